@@ -3,8 +3,13 @@ PDF Toolkit Pro - Usage Examples
 Demonstrates how to use the toolkit programmatically
 """
 
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from pdf_toolkit import merge_pdfs, split_by_pages, merge_directory
+from pdf_toolkit.config import MAX_WORKERS
+from pdf_toolkit.utils import get_pdf_files
 
 # ============================================================================
 # EXAMPLE 1: Basic Merge
@@ -94,31 +99,53 @@ def example_split_pdf():
 # EXAMPLE 5: Batch Processing
 # ============================================================================
 
+def _split_one(pdf_path: str):
+    """Split one PDF into 5-page chunks (module level so it can be pickled)"""
+    stem = Path(pdf_path).stem
+    return split_by_pages(
+        pdf_path,
+        pages_per_split=5,
+        output_pattern=f"{stem}_part{{num}}.pdf",
+        overwrite=True,
+        show_progress=False
+    )
+
+
 def example_batch_processing():
-    """Process multiple PDFs in a loop"""
+    """Process multiple PDFs in parallel worker processes"""
     print("\n=== Example 5: Batch Processing ===")
     
+    reports_dir = Path("./reports/")
+    
+    if not reports_dir.is_dir():
+        print(f"✗ Directory not found: {reports_dir}")
+        return
+    
     # List of PDF files to process
-    pdf_files = Path("./reports/").glob("*.pdf")
+    pdf_files = get_pdf_files(reports_dir)
     
-    for pdf_file in pdf_files:
-        try:
-            # Split each PDF into 5-page chunks
-            results = split_by_pages(
-                str(pdf_file),
-                pages_per_split=5,
-                output_pattern=f"{pdf_file.stem}_part{{num}}.pdf",
-                overwrite=True
-            )
-            print(f"✓ Processed: {pdf_file.name} -> {len(results)} files")
-        except Exception as e:
-            print(f"✗ Error processing {pdf_file.name}: {e}")
+    # Splitting is CPU-bound, so use processes rather than threads
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_split_one, str(pdf_file)) for pdf_file in pdf_files
+        ]
+        
+        for pdf_file, future in zip(pdf_files, futures):
+            try:
+                results = future.result()
+                print(f"✓ Processed: {pdf_file.name} -> {len(results)} files")
+            except Exception as e:
+                print(f"✗ Error processing {pdf_file.name}: {e}")
 
 
 # ============================================================================
 # EXAMPLE 6: Automation Script
 # ============================================================================
 
+# Monthly report filenames look like: report_2024-01-15.pdf
+_REPORT_RE = re.compile(r'^report_(\d{4})-(0[1-9]|1[0-2])-\d{2}$')
+
+
 def example_automation():
     """
     Real-world automation example:
@@ -126,29 +153,26 @@ def example_automation():
     """
     print("\n=== Example 6: Automation Script ===")
     
-    import os
-    from datetime import datetime
-    
     reports_dir = Path("./monthly_reports/")
     output_dir = Path("./annual_reports/")
+    
+    if not reports_dir.is_dir():
+        print(f"✗ Directory not found: {reports_dir}")
+        return
+    
     output_dir.mkdir(exist_ok=True)
     
     # Group files by month
-    files_by_month = {}
+    files_by_month = defaultdict(list)
     
-    for pdf_file in reports_dir.glob("*.pdf"):
-        # Assume filename format: report_2024-01-15.pdf
-        try:
-            date_str = pdf_file.stem.split("_")[1]
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            month_key = date.strftime("%Y-%m")
-            
-            if month_key not in files_by_month:
-                files_by_month[month_key] = []
-            
-            files_by_month[month_key].append(str(pdf_file))
-        except:
+    for pdf_file in get_pdf_files(reports_dir):
+        # Skip files that don't follow the report naming scheme
+        match = _REPORT_RE.match(pdf_file.stem)
+        if not match:
             continue
+        
+        month_key = f"{match.group(1)}-{match.group(2)}"
+        files_by_month[month_key].append(str(pdf_file))
     
     # Merge each month's reports
     for month, files in files_by_month.items():
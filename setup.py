@@ -31,10 +31,11 @@ setup(
         "click>=8.0.0",
         "Pillow>=10.0.0",
         "tqdm>=4.60.0",
-        "colorama>=0.4.0",
+        "colorama>=0.4.0; sys_platform == 'win32'",
     ],
     extras_require={
         "ocr": ["pytesseract>=0.3.0"],
+        "fast": ["pikepdf>=8.0.0"],
         "dev": ["pytest>=8.0.0", "pytest-cov>=4.0.0", "black>=24.0.0", "flake8>=7.0.0"],
     },
     entry_points={
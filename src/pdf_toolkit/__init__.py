@@ -11,7 +11,12 @@ __author__ = "Aroom Diaz Neyra"
 __license__ = "MIT"
 
 from .merge import merge_pdfs, merge_directory, merge_with_bookmarks
-from .split import split_by_pages, split_at_pages, split_into_singles
+from .split import (
+    split_by_pages,
+    split_at_pages,
+    split_into_singles,
+    split_into_singles_async,
+)
 
 __all__ = [
     'merge_pdfs',
@@ -20,4 +25,5 @@ __all__ = [
     'split_by_pages',
     'split_at_pages',
     'split_into_singles',
+    'split_into_singles_async',
 ]
@@ -4,6 +4,8 @@ Professional CLI for PDF manipulation
 """
 
 import click
+import logging
+import os
 from pathlib import Path
 import sys
 
@@ -70,6 +72,10 @@ def cli(ctx):
       $ pdf-toolkit extract doc.pdf --pages 1,5,10-15 -o selection.pdf
     """
     ctx.ensure_object(dict)
+    
+    # pikepdf logs its own setup at INFO when imported, which the root
+    # logger configured in utils would otherwise print on every split
+    logging.getLogger("pikepdf").setLevel(logging.WARNING)
 
 
 # ============================================================================
@@ -99,7 +105,15 @@ def cli(ctx):
     is_flag=True,
     help='Disable progress bar'
 )
-def merge(input_files, output, overwrite, bookmarks, no_progress):
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of input files to read in parallel '
+         '(helps most for files on a network filesystem)'
+)
+def merge(input_files, output, overwrite, bookmarks, no_progress, jobs):
     """
     Merge multiple PDF files into one.
     
@@ -113,20 +127,25 @@ def merge(input_files, output, overwrite, bookmarks, no_progress):
       
       Merge all PDFs in directory:
       $ pdf-toolkit merge folder/*.pdf -o result.pdf
+      
+      Read 4 input files at a time:
+      $ pdf-toolkit merge /mnt/share/*.pdf -o result.pdf --jobs 4
     """
     try:
         if bookmarks:
             merge_with_bookmarks(
                 list(input_files),
                 output,
-                overwrite=overwrite
+                overwrite=overwrite,
+                parallel_readers=jobs
             )
         else:
             merge_pdfs(
                 list(input_files),
                 output,
                 overwrite=overwrite,
-                show_progress=not no_progress
+                show_progress=not no_progress,
+                parallel_readers=jobs
             )
     except Exception as e:
         print_error(f"Merge failed: {e}")
@@ -151,7 +170,15 @@ def merge(input_files, output, overwrite, bookmarks, no_progress):
     is_flag=True,
     help='Overwrite output file if it exists'
 )
-def merge_dir(directory, output, recursive, overwrite):
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of input files to read in parallel '
+         '(helps most for files on a network filesystem)'
+)
+def merge_dir(directory, output, recursive, overwrite, jobs):
     """
     Merge all PDF files in a directory.
     
@@ -168,7 +195,8 @@ def merge_dir(directory, output, recursive, overwrite):
             directory,
             output,
             recursive=recursive,
-            overwrite=overwrite
+            overwrite=overwrite,
+            parallel_readers=jobs
         )
     except Exception as e:
         print_error(f"Merge directory failed: {e}")
@@ -197,7 +225,14 @@ def merge_dir(directory, output, recursive, overwrite):
     is_flag=True,
     help='Overwrite output files if they exist'
 )
-def split(input_file, pages, pattern, overwrite):
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of workers writing output files in parallel'
+)
+def split(input_file, pages, pattern, overwrite, jobs):
     """
     Split PDF into multiple files.
     
@@ -214,7 +249,8 @@ def split(input_file, pages, pattern, overwrite):
             input_file,
             pages,
             output_pattern=pattern,
-            overwrite=overwrite
+            overwrite=overwrite,
+            num_workers=jobs
         )
     except Exception as e:
         print_error(f"Split failed: {e}")
@@ -241,7 +277,14 @@ def split(input_file, pages, pattern, overwrite):
     is_flag=True,
     help='Overwrite output files if they exist'
 )
-def split_at(input_file, split_points, pattern, overwrite):
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of workers writing output files in parallel'
+)
+def split_at(input_file, split_points, pattern, overwrite, jobs):
     """
     Split PDF at specific page numbers.
     
@@ -257,7 +300,8 @@ def split_at(input_file, split_points, pattern, overwrite):
             input_file,
             list(split_points),
             output_pattern=pattern,
-            overwrite=overwrite
+            overwrite=overwrite,
+            num_workers=jobs
         )
     except Exception as e:
         print_error(f"Split at pages failed: {e}")
@@ -281,7 +325,14 @@ def split_at(input_file, split_points, pattern, overwrite):
     is_flag=True,
     help='Overwrite output files if they exist'
 )
-def split_pages(input_file, output_dir, pattern, overwrite):
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of workers writing output files in parallel'
+)
+def split_pages(input_file, output_dir, pattern, overwrite, jobs):
     """
     Split PDF into individual pages.
     
@@ -292,13 +343,17 @@ def split_pages(input_file, output_dir, pattern, overwrite):
       
       Save to specific directory:
       $ pdf-toolkit split-pages doc.pdf --output-dir ./pages/
+      
+      Use 4 workers:
+      $ pdf-toolkit split-pages doc.pdf --output-dir ./pages/ --jobs 4
     """
     try:
         split_into_singles(
             input_file,
             output_dir=output_dir,
             output_pattern=pattern,
-            overwrite=overwrite
+            overwrite=overwrite,
+            num_workers=jobs
         )
     except Exception as e:
         print_error(f"Split into pages failed: {e}")
@@ -322,31 +377,36 @@ def info(pdf_file):
         from .utils import format_file_size
         
         path = Path(pdf_file)
-        reader = PdfReader(str(path))
+        reader = PdfReader(os.fspath(path), strict=False)
         
         # File info
         file_size = path.stat().st_size
         
-        click.echo(f"\n📄 PDF Information: {path.name}\n")
-        click.echo(f"  Path:       {path.absolute()}")
-        click.echo(f"  Size:       {format_file_size(file_size)}")
-        click.echo(f"  Pages:      {len(reader.pages)}")
+        # Collect all lines and echo them in a single write
+        lines = [
+            f"\n📄 PDF Information: {path.name}\n",
+            f"  Path:       {path.absolute()}",
+            f"  Size:       {format_file_size(file_size)}",
+            f"  Pages:      {len(reader.pages)}",
+        ]
         
         # Metadata
-        if reader.metadata:
-            click.echo(f"\n  Metadata:")
-            if reader.metadata.title:
-                click.echo(f"    Title:    {reader.metadata.title}")
-            if reader.metadata.author:
-                click.echo(f"    Author:   {reader.metadata.author}")
-            if reader.metadata.subject:
-                click.echo(f"    Subject:  {reader.metadata.subject}")
-            if reader.metadata.creator:
-                click.echo(f"    Creator:  {reader.metadata.creator}")
-            if reader.metadata.producer:
-                click.echo(f"    Producer: {reader.metadata.producer}")
+        metadata = reader.metadata
+        if metadata:
+            lines.append(f"\n  Metadata:")
+            if metadata.title:
+                lines.append(f"    Title:    {metadata.title}")
+            if metadata.author:
+                lines.append(f"    Author:   {metadata.author}")
+            if metadata.subject:
+                lines.append(f"    Subject:  {metadata.subject}")
+            if metadata.creator:
+                lines.append(f"    Creator:  {metadata.creator}")
+            if metadata.producer:
+                lines.append(f"    Producer: {metadata.producer}")
         
-        click.echo()
+        lines.append("")
+        click.echo("\n".join(lines))
         
     except Exception as e:
         print_error(f"Failed to read PDF info: {e}")
@@ -379,8 +439,14 @@ def count(pdf_file):
         from pathlib import Path
         
         path = Path(pdf_file)
-        reader = PdfReader(str(path))
-        num_pages = len(reader.pages)
+        reader = PdfReader(os.fspath(path), strict=False)
+        
+        # The page tree root records the total page count, so read it
+        # instead of flattening every page object via reader.pages
+        try:
+            num_pages = int(reader.trailer['/Root']['/Pages']['/Count'])
+        except (KeyError, TypeError, ValueError):
+            num_pages = len(reader.pages)
         
         click.echo(f"\n📄 {path.name} has {num_pages} page{'s' if num_pages != 1 else ''}\n")
         
@@ -3,13 +3,19 @@ PDF Toolkit Pro - Merge Module
 Combine multiple PDF files into a single document
 """
 
+import logging
+import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
-from pypdf import PdfWriter, PdfReader
-from tqdm import tqdm
+from typing import Iterator, List, Optional
+from pypdf import PdfReader, PdfWriter
 
+from .config import CHUNK_SIZE
 from .utils import (
     validate_pdf_file,
+    open_pdf_reader,
     validate_output_path,
     get_pdf_files,
     format_file_size,
@@ -23,23 +29,32 @@ def merge_pdfs(
     input_files: List[str],
     output_file: str,
     overwrite: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    parallel_readers: int = 1
 ) -> Path:
     """
     Merge multiple PDF files into a single PDF.
     
+    With parallel_readers > 1, input files are parsed concurrently in a
+    thread pool; pages are still appended to the output on the calling
+    thread, in input order. This helps most when reading is slow, e.g.
+    for inputs on a network filesystem. A single input file is parsed
+    to check it, then copied as-is without being re-serialized.
+    
     Args:
         input_files: List of input PDF file paths
         output_file: Output PDF file path
         overwrite: Whether to overwrite existing output file
         show_progress: Whether to show progress bar
+        parallel_readers: Number of input files parsed at the same time
         
     Returns:
         Path to the created PDF file
         
     Raises:
         FileNotFoundError: If any input file doesn't exist
-        ValueError: If input list is empty or files are invalid
+        ValueError: If input list is empty, files are invalid, or a
+                    single input file is also the output file
         FileExistsError: If output exists and overwrite is False
         
     Example:
@@ -50,49 +65,95 @@ def merge_pdfs(
     if not input_files:
         raise ValueError("No input files provided")
     
-    if len(input_files) < 2:
-        raise ValueError("At least 2 PDF files are required for merging")
-    
     # Validate all input files
     validated_files = [validate_pdf_file(f) for f in input_files]
     output_path = validate_output_path(output_file, overwrite)
     
+    return _merge_validated_paths(
+        validated_files,
+        output_path,
+        show_progress,
+        parallel_readers
+    )
+
+
+def _merge_validated_paths(
+    validated_files: List[Path],
+    output_path: Path,
+    show_progress: bool,
+    parallel_readers: int
+) -> Path:
+    """
+    Merge input files that have already been validated.
+    
+    Shared by merge_pdfs and merge_directory so that callers which
+    already know their inputs are valid don't validate them twice.
+    """
+    # Nothing to merge: copy the bytes instead of rewriting them
+    if len(validated_files) == 1:
+        input_path = validated_files[0]
+        
+        if output_path.exists() and output_path.samefile(input_path):
+            raise ValueError(
+                f"Output file is the same as the input file: {output_path}"
+            )
+        
+        # Still parse the input, so a corrupt file fails as it would
+        # in a merge of several files
+        open_pdf_reader(input_path).stream.close()
+        
+        shutil.copyfile(input_path, output_path)
+        print_success(
+            f"Copied {input_path.name} → {output_path.name} "
+            f"(single input file)"
+        )
+        return output_path
+    
     print_info(f"Merging {len(validated_files)} PDF files...")
     
-    # Create PDF writer
+    # Create PDF writer and the (lazy) stream of input readers
     merger = PdfWriter()
+    readers = _iter_readers(validated_files, parallel_readers)
     
-    # Progress bar setup
-    progress_bar = tqdm(
-        validated_files,
-        desc="Merging",
-        unit="file",
-        disable=not show_progress
-    )
+    # Progress bar setup (a disabled tqdm still wraps every iteration,
+    # so skip it entirely when no progress is wanted)
+    if show_progress:
+        from tqdm import tqdm
+        progress_bar = tqdm(validated_files, desc="Merging", unit="file")
+    else:
+        progress_bar = validated_files
     
     try:
         total_pages = 0
         
-        for pdf_file in progress_bar:
-            progress_bar.set_postfix(file=pdf_file.name)
+        # Checked once so the loop doesn't build messages nobody sees
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        for pdf_file, reader in zip(progress_bar, readers):
+            if show_progress:
+                progress_bar.set_postfix(file=pdf_file.name)
             
-            # Read and append PDF
-            reader = PdfReader(str(pdf_file))
             num_pages = len(reader.pages)
             
-            for page in reader.pages:
-                merger.add_page(page)
+            merger.append(reader, import_outline=False)
+            
+            # The writer now holds its own copies of the pages, so the
+            # reader's in-memory copy of the file can be released. The
+            # reader object itself stays referenced by the writer until
+            # it is closed; only its stream buffer is freed here.
+            reader.stream.close()
             
             total_pages += num_pages
-            logger.debug(f"Added {pdf_file.name} ({num_pages} pages)")
+            if debug_enabled:
+                logger.debug(f"Added {pdf_file.name} ({num_pages} pages)")
         
         # Write output file
         print_info(f"Writing output file: {output_path.name}")
-        with open(output_path, 'wb') as output:
+        with open(output_path, 'wb', buffering=CHUNK_SIZE) as output:
             merger.write(output)
-        
-        # Get file size
-        file_size = output_path.stat().st_size
+            
+            # Bytes written so far, without a stat() after closing
+            file_size = output.tell()
         
         print_success(
             f"Merged {len(validated_files)} files "
@@ -106,15 +167,55 @@ def merge_pdfs(
         logger.error(f"Error during merge: {e}")
         raise
     finally:
+        readers.close()
         merger.close()
 
 
+def _iter_readers(
+    pdf_files: List[Path],
+    parallel_readers: int
+) -> Iterator[PdfReader]:
+    """
+    Parse each (already validated) PDF file and yield its reader, in
+    input order.
+    
+    With parallel_readers > 1 the files are parsed ahead of time in a
+    thread pool. Only a bounded number of files are read ahead, so
+    memory use doesn't grow with the number of inputs.
+    """
+    if parallel_readers <= 1:
+        for pdf_file in pdf_files:
+            yield open_pdf_reader(pdf_file)
+        return
+    
+    with ThreadPoolExecutor(max_workers=parallel_readers) as executor:
+        pending_files = iter(pdf_files)
+        pending = deque(
+            executor.submit(open_pdf_reader, f)
+            for f in islice(pending_files, parallel_readers * 2)
+        )
+        
+        try:
+            while pending:
+                reader = pending.popleft().result()
+                for next_file in islice(pending_files, 1):
+                    pending.append(
+                        executor.submit(open_pdf_reader, next_file)
+                    )
+                yield reader
+        finally:
+            # Don't keep parsing the remaining files after a failure
+            for future in pending:
+                future.cancel()
+
+
 def merge_directory(
     directory: str,
     output_file: str,
     recursive: bool = False,
     overwrite: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    parallel_readers: int = 1
 ) -> Path:
     """
     Merge all PDF files in a directory.
@@ -125,6 +226,7 @@ def merge_directory(
         recursive: Whether to search subdirectories
         overwrite: Whether to overwrite existing output file
         show_progress: Whether to show progress bar
+        parallel_readers: Number of input files parsed at the same time
         
     Returns:
         Path to the created PDF file
@@ -144,17 +246,23 @@ def merge_directory(
         f"{'directory tree' if recursive else 'directory'}"
     )
     
-    # Convert to strings for merge_pdfs
-    file_paths = [str(f) for f in pdf_files]
+    # Files found by get_pdf_files are known to exist and be PDFs
+    output_path = validate_output_path(output_file, overwrite)
     
-    return merge_pdfs(file_paths, output_file, overwrite, show_progress)
+    return _merge_validated_paths(
+        pdf_files,
+        output_path,
+        show_progress,
+        parallel_readers
+    )
 
 
 def merge_with_bookmarks(
     input_files: List[str],
     output_file: str,
     bookmark_titles: Optional[List[str]] = None,
-    overwrite: bool = False
+    overwrite: bool = False,
+    parallel_readers: int = 1
 ) -> Path:
     """
     Merge PDFs and add bookmarks for each original file.
@@ -165,6 +273,7 @@ def merge_with_bookmarks(
         bookmark_titles: Optional custom titles for bookmarks
                         (if None, uses filenames)
         overwrite: Whether to overwrite existing output file
+        parallel_readers: Number of input files parsed at the same time
         
     Returns:
         Path to the created PDF file
@@ -188,27 +297,33 @@ def merge_with_bookmarks(
     print_info(f"Merging {len(validated_files)} PDFs with bookmarks...")
     
     merger = PdfWriter()
-    current_page = 0
+    readers = _iter_readers(validated_files, parallel_readers)
     
     try:
-        for pdf_file, title in zip(validated_files, bookmark_titles):
-            reader = PdfReader(str(pdf_file))
-            
-            # Add bookmark at the start of this PDF
-            merger.add_outline_item(title, current_page)
-            
-            # Add all pages
-            for page in reader.pages:
-                merger.add_page(page)
+        # First pass: append all pages, remembering where each file starts
+        offsets = []
+        
+        for reader in readers:
+            offsets.append(len(merger.pages))
+            merger.append(reader, import_outline=False)
             
-            current_page += len(reader.pages)
-            logger.debug(f"Added {pdf_file.name} with bookmark '{title}'")
+            reader.stream.close()
+        
+        # Second pass: one bookmark per file, anchored at its first page
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        for pdf_file, title, offset in zip(
+            validated_files, bookmark_titles, offsets
+        ):
+            merger.add_outline_item(title, offset)
+            if debug_enabled:
+                logger.debug(f"Added {pdf_file.name} with bookmark '{title}'")
         
         # Write output
-        with open(output_path, 'wb') as output:
+        with open(output_path, 'wb', buffering=CHUNK_SIZE) as output:
             merger.write(output)
+            file_size = output.tell()
         
-        file_size = output_path.stat().st_size
         print_success(
             f"Created {output_path.name} with {len(bookmark_titles)} bookmarks "
             f"({format_file_size(file_size)})"
@@ -220,4 +335,5 @@ def merge_with_bookmarks(
         logger.error(f"Error during merge with bookmarks: {e}")
         raise
     finally:
+        readers.close()
         merger.close()
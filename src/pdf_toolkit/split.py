@@ -3,14 +3,26 @@ PDF Toolkit Pro - Split Module
 Split PDF files into multiple documents
 """
 
+import asyncio
+import functools
+import io
+import logging
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed
+)
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 from pypdf import PdfWriter, PdfReader
-from tqdm import tqdm
 
 from .utils import (
     validate_pdf_file,
-    validate_output_path,
+    open_pdf_reader,
     format_file_size,
     print_success,
     print_info,
@@ -18,12 +30,288 @@ from .utils import (
 )
 
 
+# pikepdf module once looked up by _pikepdf (False if not installed)
+_pikepdf_module = None
+
+# Source PDF and its pages in the current worker thread or process,
+# see _init_split_worker
+_worker = threading.local()
+
+
+def _pikepdf():
+    """
+    Return the pikepdf module, or None if it isn't installed.
+    
+    pikepdf is optional (pdf-toolkit-pro[fast]) and slow to import, so
+    it is only imported the first time a split needs it rather than
+    whenever the package is imported.
+    """
+    global _pikepdf_module
+    
+    if _pikepdf_module is None:
+        try:
+            import pikepdf
+        except ImportError:
+            pikepdf = False
+        _pikepdf_module = pikepdf
+    
+    return _pikepdf_module or None
+
+
+def _open_source(input_path: Path) -> Union[PdfReader, "pikepdf.Pdf"]:
+    """
+    Open the PDF to split.
+    
+    Uses pikepdf (libqpdf) when it is installed, otherwise pypdf on a
+    read-only memory map of the file. Release the result with
+    _close_source.
+    """
+    pikepdf = _pikepdf()
+    
+    if pikepdf is not None:
+        return pikepdf.open(os.fspath(input_path))
+    
+    # Map the file instead of letting pypdf read it all into a BytesIO
+    # copy; pages are then read straight from the OS page cache
+    with open(input_path, 'rb') as fh:
+        # An empty file can't be mapped; let pypdf report it as it
+        # does for merges
+        if os.fstat(fh.fileno()).st_size == 0:
+            return open_pdf_reader(input_path)
+        
+        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        return PdfReader(mapped)
+    except Exception:
+        mapped.close()
+        raise
+
+
+def _close_source(source: Union[PdfReader, "pikepdf.Pdf"]) -> None:
+    """Release a PDF opened by _open_source."""
+    if isinstance(source, PdfReader):
+        source.stream.close()
+    else:
+        source.close()
+
+
+def _page_list(source: Union[PdfReader, "pikepdf.Pdf"]) -> Sequence:
+    """
+    Return the pages of an opened source as an indexable sequence.
+    
+    pypdf's reader.pages resolves every index through a lazy wrapper;
+    materializing it once turns later lookups into plain list indexing.
+    """
+    if isinstance(source, PdfReader):
+        return list(source.pages)
+    
+    return source.pages
+
+
+def _write_pages(
+    pages: Sequence,
+    start: int,
+    end: int,
+    output_path: Path
+) -> None:
+    """
+    Write pages [start, end) of an opened source PDF to a new file.
+    
+    With pikepdf the pages are copied as qpdf object handles, so content
+    streams are written out without being decoded and re-encoded.
+    """
+    pikepdf = _pikepdf()
+    
+    if pikepdf is not None:
+        dst = pikepdf.Pdf.new()
+        dst.pages.extend(pages[start:end])
+        dst.save(os.fspath(output_path))
+        return
+    
+    writer = PdfWriter()
+    
+    for page in pages[start:end]:
+        writer.add_page(page)
+    
+    # pypdf serializes with many small writes; collect them in memory
+    # and hand the whole file to the OS in a single write
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    
+    with open(output_path, 'wb') as output:
+        output.write(buffer.getbuffer())
+
+
+def _check_overwrite(path: Path, overwrite: bool) -> Path:
+    """
+    Per-file part of validate_output_path, for the many outputs of a split.
+    
+    Only checks for an existing file (os.path.lexists is a single lstat);
+    parent directories are created once per split by _make_output_dirs.
+    
+    Raises:
+        FileExistsError: If file exists and overwrite is False
+    """
+    if not overwrite and os.path.lexists(path):
+        raise FileExistsError(
+            f"Output file already exists: {path}\n"
+            f"Use --overwrite flag to replace it."
+        )
+    
+    return path
+
+
+def _make_output_dirs(jobs: List[Tuple[int, int, Path]]) -> None:
+    """Create the parent directory of every output file, once each."""
+    for directory in {output_path.parent for _, _, output_path in jobs}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def _init_split_worker(input_path: str, pikepdf_log_level: int) -> None:
+    """
+    Open the source PDF once per worker thread or process.
+    
+    Spawned worker processes start with fresh logging, so the caller's
+    level for the pikepdf logger is passed along and applied again.
+    """
+    logging.getLogger("pikepdf").setLevel(pikepdf_log_level)
+    _worker.source = _open_source(Path(input_path))
+    _worker.pages = _page_list(_worker.source)
+
+
+def _write_split(start: int, end: int, output_path: str) -> None:
+    """Write one split from a worker (module level for pickling)."""
+    _write_pages(_worker.pages, start, end, Path(output_path))
+
+
+def _pick_executor(wall_time: float, cpu_time: float) -> type:
+    """
+    Pick the pool for the remaining splits from how the first one ran.
+    
+    A split that kept the CPU busy is serializing in Python under the
+    GIL and needs processes to scale. One that mostly waited on the
+    disk (e.g. large image streams) runs just as well in threads, which
+    start faster and don't need a new interpreter per worker.
+    """
+    if wall_time > 0 and cpu_time / wall_time < 0.5:
+        return ThreadPoolExecutor
+    return ProcessPoolExecutor
+
+
+class _NoProgress:
+    """Stands in for a tqdm bar when no progress is shown."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def update(self, n: int = 1) -> None:
+        pass
+
+
+def _progress_bar(total: int, desc: str, unit: str, show_progress: bool):
+    """
+    Return a progress bar context for the split jobs.
+    
+    tqdm is only imported when the bar is actually shown.
+    """
+    if not show_progress:
+        return _NoProgress()
+    
+    from tqdm import tqdm
+    
+    # Redraw at most every 1% of the jobs and twice a second; for
+    # thousands of single pages the default refresh checks add up
+    return tqdm(
+        total=total,
+        desc=desc,
+        unit=unit,
+        miniters=max(1, total // 100),
+        mininterval=0.5,
+        smoothing=0
+    )
+
+
+def _write_splits(
+    input_path: Path,
+    pages: Sequence,
+    jobs: List[Tuple[int, int, Path]],
+    num_workers: Optional[int],
+    show_progress: bool,
+    desc: str,
+    unit: str,
+    executor_class: Optional[type] = None
+) -> None:
+    """
+    Write every (start, end, output_path) job.
+    
+    With more than one worker, the first job is written here and timed,
+    and the rest are spread over a process or thread pool depending on
+    whether it was CPU-bound (see _pick_executor), unless executor_class
+    forces the kind of pool. Each worker opens the
+    input once; pdf objects can't be shared between processes, and
+    neither pypdf nor pikepdf objects are safe to share between threads.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = min(num_workers, len(jobs))
+    
+    with _progress_bar(len(jobs), desc, unit, show_progress) as progress:
+        if num_workers <= 1:
+            for start, end, output_path in jobs:
+                _write_pages(pages, start, end, output_path)
+                progress.update()
+            return
+        
+        if executor_class is None:
+            start, end, output_path = jobs[0]
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            
+            _write_pages(pages, start, end, output_path)
+            progress.update()
+            
+            executor_class = _pick_executor(
+                time.perf_counter() - wall_start,
+                time.process_time() - cpu_start
+            )
+            jobs = jobs[1:]
+        
+        with executor_class(
+            max_workers=min(num_workers, len(jobs)),
+            initializer=_init_split_worker,
+            initargs=(
+                os.fspath(input_path),
+                logging.getLogger("pikepdf").level
+            )
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _write_split, start, end, os.fspath(output_path)
+                )
+                for start, end, output_path in jobs
+            ]
+            
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    progress.update()
+            finally:
+                # Don't keep writing the remaining files after a failure
+                for future in futures:
+                    future.cancel()
+
+
 def split_by_pages(
     input_file: str,
     pages_per_split: int,
     output_pattern: str = "{base}_{num}.pdf",
     overwrite: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    num_workers: Optional[int] = 1
 ) -> List[Path]:
     """
     Split PDF into multiple files with specified pages per file.
@@ -36,6 +324,8 @@ def split_by_pages(
                        {num} = split number (1, 2, 3, ...)
         overwrite: Whether to overwrite existing files
         show_progress: Whether to show progress bar
+        num_workers: Number of workers writing output files
+                    (1 = write in this process, None = one per CPU core)
         
     Returns:
         List of created PDF file paths
@@ -51,62 +341,52 @@ def split_by_pages(
         raise ValueError("pages_per_split must be at least 1")
     
     # Read input PDF
-    reader = PdfReader(str(input_path))
-    total_pages = len(reader.pages)
-    
-    print_info(
-        f"Splitting {input_path.name} ({total_pages} pages) "
-        f"into files of {pages_per_split} pages each"
-    )
-    
-    # Calculate number of output files
-    num_splits = (total_pages + pages_per_split - 1) // pages_per_split
-    
-    output_files = []
-    
-    # Progress bar
-    progress = tqdm(
-        range(num_splits),
-        desc="Splitting",
-        unit="file",
-        disable=not show_progress
-    )
+    source = _open_source(input_path)
     
     try:
-        for split_num in progress:
-            # Calculate page range for this split
-            start_page = split_num * pages_per_split
+        pages = _page_list(source)
+        total_pages = len(pages)
+        
+        print_info(
+            f"Splitting {input_path.name} ({total_pages} pages) "
+            f"into files of {pages_per_split} pages each"
+        )
+        
+        # Calculate page range and output file for each split
+        base = input_path.stem
+        parent_dir = input_path.parent
+        jobs = []
+        
+        for start_page in range(0, total_pages, pages_per_split):
             end_page = min(start_page + pages_per_split, total_pages)
             
-            # Create output filename
             output_name = output_pattern.format(
-                base=input_path.stem,
-                num=split_num + 1
+                base=base,
+                num=len(jobs) + 1
             )
-            output_path = input_path.parent / output_name
-            
-            # Validate output path
-            output_path = validate_output_path(str(output_path), overwrite)
-            
-            # Create PDF writer for this split
-            writer = PdfWriter()
-            
-            # Add pages to this split
-            for page_num in range(start_page, end_page):
-                writer.add_page(reader.pages[page_num])
-            
-            # Write output file
-            with open(output_path, 'wb') as output:
-                writer.write(output)
-            
-            output_files.append(output_path)
-            
-            file_size = output_path.stat().st_size
-            logger.debug(
-                f"Created {output_path.name}: "
-                f"pages {start_page + 1}-{end_page} "
-                f"({format_file_size(file_size)})"
+            output_path = _check_overwrite(
+                parent_dir / output_name, overwrite
             )
+            
+            jobs.append((start_page, end_page, output_path))
+        
+        _make_output_dirs(jobs)
+        _write_splits(
+            input_path, pages, jobs, num_workers,
+            show_progress, desc="Splitting", unit="file"
+        )
+        
+        output_files = [output_path for _, _, output_path in jobs]
+        
+        # Only stat the outputs when the messages will be shown
+        if logger.isEnabledFor(logging.DEBUG):
+            for start_page, end_page, output_path in jobs:
+                file_size = output_path.stat().st_size
+                logger.debug(
+                    f"Created {output_path.name}: "
+                    f"pages {start_page + 1}-{end_page} "
+                    f"({format_file_size(file_size)})"
+                )
         
         print_success(
             f"Split into {len(output_files)} files "
@@ -118,13 +398,16 @@ def split_by_pages(
     except Exception as e:
         logger.error(f"Error during split: {e}")
         raise
+    finally:
+        _close_source(source)
 
 
 def split_at_pages(
     input_file: str,
     split_points: List[int],
     output_pattern: str = "{base}_part{num}.pdf",
-    overwrite: bool = False
+    overwrite: bool = False,
+    num_workers: Optional[int] = 1
 ) -> List[Path]:
     """
     Split PDF at specific page numbers.
@@ -136,6 +419,8 @@ def split_at_pages(
                       pages 1-4, 5-9, 10-end)
         output_pattern: Pattern for output files
         overwrite: Whether to overwrite existing files
+        num_workers: Number of workers writing output files
+                    (1 = write in this process, None = one per CPU core)
         
     Returns:
         List of created PDF file paths
@@ -146,66 +431,72 @@ def split_at_pages(
     """
     # Validation
     input_path = validate_pdf_file(input_file)
-    reader = PdfReader(str(input_path))
-    total_pages = len(reader.pages)
     
     if not split_points:
         raise ValueError("No split points provided")
     
-    # Validate split points
-    split_points = sorted(set(split_points))
-    for point in split_points:
-        if point < 1 or point > total_pages:
-            raise ValueError(
-                f"Invalid split point: {point}. "
-                f"Must be between 1 and {total_pages}"
-            )
-    
-    print_info(
-        f"Splitting {input_path.name} at pages: "
-        f"{', '.join(map(str, split_points))}"
-    )
-    
-    # Create ranges
-    ranges = []
-    start = 0
-    
-    for point in split_points:
-        ranges.append((start, point - 1))  # 0-indexed, exclusive end
-        start = point - 1
-    ranges.append((start, total_pages))
-    
-    output_files = []
+    source = _open_source(input_path)
     
     try:
+        pages = _page_list(source)
+        total_pages = len(pages)
+        
+        # Validate split points
+        split_points = sorted(set(split_points))
+        for point in split_points:
+            if point < 1 or point > total_pages:
+                raise ValueError(
+                    f"Invalid split point: {point}. "
+                    f"Must be between 1 and {total_pages}"
+                )
+        
+        print_info(
+            f"Splitting {input_path.name} at pages: "
+            f"{', '.join(map(str, split_points))}"
+        )
+        
+        # Create ranges
+        ranges = []
+        start = 0
+        
+        for point in split_points:
+            ranges.append((start, point - 1))  # 0-indexed, exclusive end
+            start = point - 1
+        ranges.append((start, total_pages))
+        
+        # Output file for each range
+        base = input_path.stem
+        parent_dir = input_path.parent
+        jobs = []
+        
         for part_num, (start, end) in enumerate(ranges, 1):
-            # Create output filename
             output_name = output_pattern.format(
-                base=input_path.stem,
+                base=base,
                 num=part_num
             )
-            output_path = input_path.parent / output_name
-            output_path = validate_output_path(str(output_path), overwrite)
-            
-            # Create PDF writer
-            writer = PdfWriter()
-            
-            # Add pages
-            for page_num in range(start, end):
-                writer.add_page(reader.pages[page_num])
-            
-            # Write file
-            with open(output_path, 'wb') as output:
-                writer.write(output)
-            
-            output_files.append(output_path)
-            
-            file_size = output_path.stat().st_size
-            logger.info(
-                f"Created {output_path.name}: "
-                f"pages {start + 1}-{end} "
-                f"({format_file_size(file_size)})"
+            output_path = _check_overwrite(
+                parent_dir / output_name, overwrite
             )
+            
+            jobs.append((start, end, output_path))
+        
+        _make_output_dirs(jobs)
+        _write_splits(
+            input_path, pages, jobs, num_workers,
+            show_progress=False, desc="Splitting", unit="file"
+        )
+        
+        output_files = [output_path for _, _, output_path in jobs]
+        
+        # Only stat the outputs when the messages will be shown
+        if logger.isEnabledFor(logging.INFO):
+            for start, end, output_path in jobs:
+                file_size = output_path.stat().st_size
+                logger.info(
+                    f"Created {output_path.name}: "
+                    f"pages {start + 1}-{end} "
+                    f"({format_file_size(file_size)})"
+                )
         
         print_success(f"Split into {len(output_files)} files")
         
@@ -214,6 +505,8 @@ def split_at_pages(
     except Exception as e:
         logger.error(f"Error during split: {e}")
         raise
+    finally:
+        _close_source(source)
 
 
 def split_into_singles(
@@ -221,7 +514,8 @@ def split_into_singles(
     output_dir: Optional[str] = None,
     output_pattern: str = "{base}_page{num}.pdf",
     overwrite: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    num_workers: Optional[int] = 1
 ) -> List[Path]:
     """
     Split PDF into individual pages.
@@ -232,53 +526,73 @@ def split_into_singles(
         output_pattern: Pattern for output files
         overwrite: Whether to overwrite existing files
         show_progress: Whether to show progress bar
+        num_workers: Number of workers writing output files
+                    (1 = write in this process, None = one per CPU core)
         
     Returns:
         List of created PDF file paths
     """
-    input_path = validate_pdf_file(input_file)
-    reader = PdfReader(str(input_path))
-    total_pages = len(reader.pages)
-    
-    # Determine output directory
-    if output_dir:
-        out_dir = Path(output_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-    else:
-        out_dir = input_path.parent
-    
-    print_info(
-        f"Splitting {input_path.name} into {total_pages} individual pages"
+    return _split_into_singles(
+        input_file,
+        output_dir,
+        output_pattern,
+        overwrite,
+        show_progress,
+        num_workers
     )
+
+
+def _split_into_singles(
+    input_file: str,
+    output_dir: Optional[str],
+    output_pattern: str,
+    overwrite: bool,
+    show_progress: bool,
+    num_workers: Optional[int],
+    executor_class: Optional[type] = None
+) -> List[Path]:
+    """
+    Implementation of split_into_singles.
+    
+    executor_class forces the pool used with more than one worker
+    instead of picking it from the first split (see _write_splits).
+    """
+    input_path = validate_pdf_file(input_file)
     
-    output_files = []
+    # Determine output directory (created with the output files)
+    out_dir = Path(output_dir) if output_dir else input_path.parent
     
-    progress = tqdm(
-        range(total_pages),
-        desc="Extracting pages",
-        unit="page",
-        disable=not show_progress
-    )
+    source = _open_source(input_path)
     
     try:
-        for page_num in progress:
-            # Create output filename
+        pages = _page_list(source)
+        total_pages = len(pages)
+        
+        print_info(
+            f"Splitting {input_path.name} into {total_pages} individual pages"
+        )
+        
+        # One single-page output file per page
+        base = input_path.stem
+        jobs = []
+        
+        for page_num in range(total_pages):
             output_name = output_pattern.format(
-                base=input_path.stem,
+                base=base,
                 num=page_num + 1
             )
-            output_path = out_dir / output_name
-            output_path = validate_output_path(str(output_path), overwrite)
-            
-            # Create single-page PDF
-            writer = PdfWriter()
-            writer.add_page(reader.pages[page_num])
-            
-            # Write file
-            with open(output_path, 'wb') as output:
-                writer.write(output)
+            output_path = _check_overwrite(out_dir / output_name, overwrite)
             
-            output_files.append(output_path)
+            jobs.append((page_num, page_num + 1, output_path))
+        
+        _make_output_dirs(jobs)
+        _write_splits(
+            input_path, pages, jobs, num_workers,
+            show_progress, desc="Extracting pages", unit="page",
+            executor_class=executor_class
+        )
+        
+        output_files = [output_path for _, _, output_path in jobs]
         
         print_success(f"Created {len(output_files)} individual page files")
         
@@ -287,3 +601,53 @@ def split_into_singles(
     except Exception as e:
         logger.error(f"Error during split into singles: {e}")
         raise
+    finally:
+        _close_source(source)
+
+
+async def split_into_singles_async(
+    input_file: str,
+    output_dir: Optional[str] = None,
+    output_pattern: str = "{base}_page{num}.pdf",
+    overwrite: bool = False,
+    num_workers: Optional[int] = 1
+) -> List[Path]:
+    """
+    Split PDF into individual pages without blocking the event loop.
+    
+    Runs split_into_singles in the loop's default thread pool, so other
+    tasks keep running while pages are serialized and written. Use
+    num_workers to also write the pages in parallel; here the workers
+    are always threads, since forking a process pool from a
+    multi-threaded asyncio process can deadlock.
+    
+    Args:
+        input_file: Input PDF file path
+        output_dir: Output directory (default: same as input file)
+        output_pattern: Pattern for output files
+        overwrite: Whether to overwrite existing files
+        num_workers: Number of workers writing output files
+                    (1 = write in one thread, None = one per CPU core)
+        
+    Returns:
+        List of created PDF file paths
+        
+    Example:
+        >>> await split_into_singles_async('doc.pdf', output_dir='pages')
+        [Path('pages/doc_page1.pdf'), Path('pages/doc_page2.pdf'), ...]
+    """
+    loop = asyncio.get_running_loop()
+    
+    return await loop.run_in_executor(
+        None,
+        functools.partial(
+            _split_into_singles,
+            input_file,
+            output_dir,
+            output_pattern,
+            overwrite,
+            show_progress=False,
+            num_workers=num_workers,
+            executor_class=ThreadPoolExecutor
+        )
+    )
@@ -4,14 +4,14 @@ Common utility functions used across the application
 """
 
 import os
+import re
 import sys
+from itertools import compress
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import logging
-from colorama import Fore, Style, init
-
-# Initialize colorama
-init(autoreset=True)
+from pypdf import PdfReader
+from pypdf.errors import PdfReadError
 
 # Setup logging
 logging.basicConfig(
@@ -20,6 +20,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ANSI escape codes used by the print_* helpers
+_GREEN = '\x1b[32m'
+_RED = '\x1b[31m'
+_YELLOW = '\x1b[33m'
+_CYAN = '\x1b[36m'
+_RESET = '\x1b[0m'
+
+# (stream, whether it is colored) for stdout and stderr, decided by
+# _colors_enabled and decided again if the stream is replaced
+_use_colors = {}
+_colorama_initialized = False
+
+# A page range token: "5" or "3-7", with optional surrounding spaces
+_RANGE_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?')
+
 
 def validate_pdf_file(filepath: str) -> Path:
     """
@@ -46,6 +61,28 @@ def validate_pdf_file(filepath: str) -> Path:
     return path
 
 
+def open_pdf_reader(path: Path) -> PdfReader:
+    """
+    Parse a PDF file that has already been validated.
+    
+    For paths that came from validate_pdf_file or get_pdf_files, so
+    they aren't checked again.
+    
+    Args:
+        path: Path to an existing PDF file
+        
+    Returns:
+        PdfReader for the file
+        
+    Raises:
+        ValueError: If the file can't be parsed
+    """
+    try:
+        return PdfReader(os.fspath(path), strict=False)
+    except PdfReadError as e:
+        raise ValueError(f"Invalid PDF file: {path} ({e})") from e
+
+
 def validate_output_path(filepath: str, overwrite: bool = False) -> Path:
     """
     Validate output path and handle overwrite logic.
@@ -93,12 +130,27 @@ def get_pdf_files(directory: str, recursive: bool = False) -> List[Path]:
     if not dir_path.is_dir():
         raise ValueError(f"Not a directory: {directory}")
     
-    pattern = '**/*.pdf' if recursive else '*.pdf'
-    pdf_files = list(dir_path.glob(pattern))
+    pdf_files = list(_scan_pdf_files(directory, recursive))
     
     return sorted(pdf_files)
 
 
+def _scan_pdf_files(directory: str, recursive: bool) -> Iterator[Path]:
+    """
+    Yield PDF files in a directory using os.scandir.
+    
+    DirEntry caches the file type from the directory listing, so unlike
+    Path.glob no extra stat() call is needed per entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _scan_pdf_files(entry.path, recursive)
+            elif entry.is_file() and entry.name.lower().endswith('.pdf'):
+                yield Path(entry.path)
+
+
 def parse_page_ranges(range_string: str, total_pages: int) -> List[int]:
     """
     Parse page range string into list of page numbers.
@@ -118,82 +170,121 @@ def parse_page_ranges(range_string: str, total_pages: int) -> List[int]:
     Raises:
         ValueError: If range specification is invalid
     """
-    pages = set()
+    # One flag per page: ranges are marked with a slice assignment and
+    # the result comes out already sorted, without a set to hash into
+    flags = bytearray(total_pages)
     
     for part in range_string.split(','):
-        part = part.strip()
-        
-        if '-' in part:
-            # Handle range (e.g., "1-5")
-            try:
-                start, end = part.split('-')
-                start = int(start.strip())
-                end = int(end.strip())
-                
-                if start < 1 or end > total_pages or start > end:
-                    raise ValueError(
-                        f"Invalid range: {part}. "
-                        f"Must be between 1 and {total_pages}"
-                    )
-                
-                pages.update(range(start - 1, end))
-                
-            except ValueError as e:
-                raise ValueError(f"Invalid range format: {part}") from e
+        match = _RANGE_RE.fullmatch(part)
+        
+        if match is None:
+            kind = 'range format' if '-' in part else 'page number'
+            raise ValueError(f"Invalid {kind}: {part.strip()}")
+        
+        start = int(match.group(1))
+        
+        if match.group(2) is None:
+            # Single page
+            if start < 1 or start > total_pages:
+                raise ValueError(
+                    f"Invalid page number: {start}. "
+                    f"Must be between 1 and {total_pages}"
+                )
+            flags[start - 1] = 1
         else:
-            # Handle single page
-            try:
-                page = int(part)
-                
-                if page < 1 or page > total_pages:
-                    raise ValueError(
-                        f"Invalid page number: {page}. "
-                        f"Must be between 1 and {total_pages}"
-                    )
-                
-                pages.add(page - 1)
-                
-            except ValueError as e:
-                raise ValueError(f"Invalid page number: {part}") from e
-    
-    return sorted(list(pages))
+            # Range (e.g., "1-5")
+            end = int(match.group(2))
+            
+            if start < 1 or end > total_pages or start > end:
+                raise ValueError(
+                    f"Invalid range: {part.strip()}. "
+                    f"Must be between 1 and {total_pages}"
+                )
+            flags[start - 1:end] = b'\x01' * (end - start + 1)
+    
+    return list(compress(range(total_pages), flags))
+
+
+# Units for format_file_size, each 1024 (2**10) times the previous one
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
     
+    The unit is picked from the bit length of the size instead of
+    dividing by 1024 until the value is small enough.
+    
     Args:
         size_bytes: Size in bytes
         
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Like the old division loop, anything below 1 KB (including
+    # negative sizes) stays in bytes
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_UNITS[index]}"
+
+
+def _colors_enabled(stream) -> bool:
+    """
+    Decide on first use whether to color output written to a stream.
+    
+    Colors are only used when the stream is a terminal, so piped or
+    redirected output stays plain text; stdout and stderr are decided
+    separately, and again whenever sys.stdout / sys.stderr is replaced
+    (e.g. by contextlib.redirect_stdout). colorama is only needed on
+    Windows, where it makes older consoles understand ANSI codes.
+    """
+    global _colorama_initialized
+    
+    name = 'stderr' if stream is sys.stderr else 'stdout'
+    cached = _use_colors.get(name)
+    
+    if cached is not None and cached[0] is stream:
+        return cached[1]
+    
+    use_colors = stream.isatty()
+    _use_colors[name] = (stream, use_colors)
+    
+    if use_colors and os.name == 'nt' and not _colorama_initialized:
+        import colorama
+        colorama.init()
+        _colorama_initialized = True
+    
+    return use_colors
+
+
+def _colored(color: str, message: str, stream) -> str:
+    """Wrap message in an ANSI color if colors are enabled for stream."""
+    if _colors_enabled(stream):
+        return f"{color}{message}{_RESET}"
+    return message
 
 
 def print_success(message: str):
     """Print success message in green."""
-    print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+    print(_colored(_GREEN, f"✓ {message}", sys.stdout))
 
 
 def print_error(message: str):
     """Print error message in red."""
-    print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", file=sys.stderr)
+    print(_colored(_RED, f"✗ {message}", sys.stderr), file=sys.stderr)
 
 
 def print_warning(message: str):
     """Print warning message in yellow."""
-    print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+    print(_colored(_YELLOW, f"⚠ {message}", sys.stdout))
 
 
 def print_info(message: str):
     """Print info message in blue."""
-    print(f"{Fore.CYAN}ℹ {message}{Style.RESET_ALL}")
+    print(_colored(_CYAN, f"ℹ {message}", sys.stdout))
 
 
 def confirm_action(message: str, default: bool = False) -> bool:
@@ -0,0 +1,140 @@
+"""
+Tests for the command line interface
+"""
+
+import pytest
+from pathlib import Path
+import click
+from click.testing import CliRunner
+from pypdf import PdfWriter
+from pypdf.generic import NameObject, TextStringObject
+import tempfile
+import shutil
+
+from pdf_toolkit import cli as cli_module
+from pdf_toolkit.cli import cli
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files"""
+    temp_path = Path(tempfile.mkdtemp())
+    yield temp_path
+    shutil.rmtree(temp_path)
+
+
+def write_pdf(pdf_path, num_pages, page_count=None):
+    """
+    Write a blank PDF; page_count replaces the page tree's /Count
+    (None keeps it, False removes it)
+    """
+    writer = PdfWriter()
+    
+    for _ in range(num_pages):
+        writer.add_blank_page(width=612, height=792)
+    
+    pages = writer._root_object['/Pages']
+    if page_count is False:
+        del pages['/Count']
+    elif page_count is not None:
+        pages[NameObject('/Count')] = page_count
+    
+    with open(pdf_path, 'wb') as f:
+        writer.write(f)
+    
+    return pdf_path
+
+
+class TestCount:
+    
+    def test_count(self, temp_dir):
+        """Test counting the pages of a normal PDF"""
+        pdf_path = write_pdf(temp_dir / "doc.pdf", 3)
+        
+        result = CliRunner().invoke(cli, ['count', str(pdf_path)])
+        
+        assert result.exit_code == 0
+        assert "doc.pdf has 3 pages" in result.output
+    
+    def test_count_without_page_count(self, temp_dir):
+        """Test falling back to the page tree when /Count is missing"""
+        pdf_path = write_pdf(temp_dir / "doc.pdf", 3, page_count=False)
+        
+        result = CliRunner().invoke(cli, ['count', str(pdf_path)])
+        
+        assert result.exit_code == 0
+        assert "doc.pdf has 3 pages" in result.output
+    
+    def test_count_with_invalid_page_count(self, temp_dir):
+        """Test falling back to the page tree when /Count isn't a number"""
+        pdf_path = write_pdf(
+            temp_dir / "doc.pdf", 2, page_count=TextStringObject("many")
+        )
+        
+        result = CliRunner().invoke(cli, ['count', str(pdf_path)])
+        
+        assert result.exit_code == 0
+        assert "doc.pdf has 2 pages" in result.output
+
+
+
+class TestInfo:
+    
+    def test_info_single_echo(self, temp_dir, monkeypatch):
+        """Test that info writes its whole report with one echo"""
+        pdf_path = write_pdf(temp_dir / "doc.pdf", 4)
+        echoes = []
+        echo = click.echo
+        
+        def recording_echo(message=None, *args, **kwargs):
+            echoes.append(message)
+            echo(message, *args, **kwargs)
+        
+        monkeypatch.setattr(cli_module.click, "echo", recording_echo)
+        
+        result = CliRunner().invoke(cli, ['info', str(pdf_path)])
+        
+        assert result.exit_code == 0
+        assert len(echoes) == 1
+        assert "PDF Information: doc.pdf" in result.output
+        assert "Pages:      4" in result.output
+
+
+
+class TestJobsOption:
+    
+    @pytest.mark.parametrize("function, args, keyword", [
+        ("merge_pdfs", ['merge', '{pdf}', '{pdf}', '-o', '{out}'],
+         'parallel_readers'),
+        ("merge_with_bookmarks",
+         ['merge', '{pdf}', '{pdf}', '-o', '{out}', '--bookmarks'],
+         'parallel_readers'),
+        ("merge_directory", ['merge-dir', '{dir}', '-o', '{out}'],
+         'parallel_readers'),
+        ("split_by_pages", ['split', '{pdf}', '-p', '1'], 'num_workers'),
+        ("split_at_pages", ['split-at', '{pdf}', '--at', '2'], 'num_workers'),
+        ("split_into_singles", ['split-pages', '{pdf}'], 'num_workers'),
+    ])
+    def test_jobs_reaches_function(
+        self, temp_dir, monkeypatch, function, args, keyword
+    ):
+        """Test that -j is passed on as the worker count"""
+        pdf_path = write_pdf(temp_dir / "doc.pdf", 3)
+        calls = []
+        monkeypatch.setattr(
+            cli_module, function, lambda *a, **kwargs: calls.append(kwargs)
+        )
+        
+        args = [
+            arg.format(pdf=pdf_path, dir=temp_dir, out=temp_dir / "out.pdf")
+            for arg in args
+        ]
+        result = CliRunner().invoke(cli, args + ['-j', '3'])
+        
+        assert result.exit_code == 0, result.output
+        assert len(calls) == 1
+        assert calls[0][keyword] == 3
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
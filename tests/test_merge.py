@@ -8,7 +8,7 @@ from pypdf import PdfWriter, PdfReader
 import tempfile
 import shutil
 
-from pdf_toolkit.merge import merge_pdfs, merge_directory
+from pdf_toolkit.merge import merge_pdfs, merge_directory, merge_with_bookmarks
 
 
 @pytest.fixture
@@ -85,6 +85,19 @@ class TestMergePDFs:
                 show_progress=False
             )
     
+    def test_merge_with_corrupt_file(self, sample_pdfs, temp_dir):
+        """Test that merge rejects a .pdf file that can't be parsed"""
+        corrupt = temp_dir / "corrupt.pdf"
+        corrupt.write_bytes(b"not really a pdf")
+        output = temp_dir / "merged.pdf"
+        
+        with pytest.raises(ValueError):
+            merge_pdfs(
+                [str(sample_pdfs[0]), str(corrupt)],
+                str(output),
+                show_progress=False
+            )
+    
     def test_merge_with_empty_list(self, temp_dir):
         """Test that merge fails with empty file list"""
         output = temp_dir / "merged.pdf"
@@ -93,11 +106,61 @@ class TestMergePDFs:
             merge_pdfs([], str(output), show_progress=False)
     
     def test_merge_single_file(self, sample_pdfs, temp_dir):
-        """Test that merge requires at least 2 files"""
+        """Test that a single input file is copied unchanged"""
+        output = temp_dir / "merged.pdf"
+        
+        result = merge_pdfs([str(sample_pdfs[0])], str(output), show_progress=False)
+        
+        assert result.read_bytes() == sample_pdfs[0].read_bytes()
+    
+    def test_merge_single_corrupt_file(self, temp_dir):
+        """Test that a single input file is still checked before copying"""
+        corrupt = temp_dir / "corrupt.pdf"
+        corrupt.write_bytes(b"not really a pdf")
         output = temp_dir / "merged.pdf"
         
         with pytest.raises(ValueError):
-            merge_pdfs([str(sample_pdfs[0])], str(output), show_progress=False)
+            merge_pdfs([str(corrupt)], str(output), show_progress=False)
+        
+        assert not output.exists()
+    
+    def test_merge_single_file_onto_itself(self, sample_pdfs):
+        """Test that a single input file can't be its own output"""
+        original = sample_pdfs[0].read_bytes()
+        
+        with pytest.raises(ValueError):
+            merge_pdfs(
+                [str(sample_pdfs[0])],
+                str(sample_pdfs[0]),
+                overwrite=True,
+                show_progress=False
+            )
+        
+        assert sample_pdfs[0].read_bytes() == original
+    
+    def test_merge_parallel_readers_keeps_order(self, temp_dir):
+        """Test that reading files in parallel keeps the input order"""
+        pdfs = []
+        for width in (100, 200, 300, 400, 500):
+            pdf_path = temp_dir / f"width_{width}.pdf"
+            writer = PdfWriter()
+            writer.add_blank_page(width=width, height=792)
+            with open(pdf_path, 'wb') as f:
+                writer.write(f)
+            pdfs.append(str(pdf_path))
+        
+        output = temp_dir / "merged_parallel.pdf"
+        
+        result = merge_pdfs(
+            pdfs,
+            str(output),
+            show_progress=False,
+            parallel_readers=2
+        )
+        
+        reader = PdfReader(str(result))
+        widths = [int(page.mediabox.width) for page in reader.pages]
+        assert widths == [100, 200, 300, 400, 500]
     
     def test_merge_overwrite_false(self, sample_pdfs, temp_dir):
         """Test that merge doesn't overwrite by default"""
@@ -175,6 +238,21 @@ class TestMergeDirectory:
                 show_progress=False
             )
     
+    def test_merge_directory_uppercase_extension(self, sample_pdfs, temp_dir):
+        """Test that files with an upper-case .PDF extension are included"""
+        sample_pdfs[0].rename(temp_dir / "SAMPLE_1.PDF")
+        output = temp_dir / "merged_upper.pdf"
+        
+        result = merge_directory(
+            str(temp_dir),
+            str(output),
+            show_progress=False
+        )
+        
+        # Should still have 15 pages (3 PDFs × 5 pages)
+        reader = PdfReader(str(result))
+        assert len(reader.pages) == 15
+    
     def test_merge_directory_recursive(self, sample_pdfs, temp_dir):
         """Test recursive directory merge"""
         # Create subdirectory with additional PDF
@@ -203,5 +281,28 @@ class TestMergeDirectory:
         assert len(reader.pages) == 20
 
 
+class TestMergeWithBookmarks:
+    
+    def test_bookmarks_point_to_file_starts(self, sample_pdfs, temp_dir):
+        """Test that each bookmark points to the first page of its file"""
+        output = temp_dir / "bookmarked.pdf"
+        
+        result = merge_with_bookmarks(
+            [str(p) for p in sample_pdfs],
+            str(output),
+            bookmark_titles=["One", "Two", "Three"]
+        )
+        
+        reader = PdfReader(str(result))
+        assert len(reader.pages) == 15
+        
+        # Each sample PDF has 5 pages
+        outline = reader.outline
+        assert [item.title for item in outline] == ["One", "Two", "Three"]
+        assert [
+            reader.get_destination_page_number(item) for item in outline
+        ] == [0, 5, 10]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
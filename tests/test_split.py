@@ -0,0 +1,250 @@
+"""
+Tests for PDF split functionality
+"""
+
+import asyncio
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from pypdf import PdfWriter, PdfReader
+import tempfile
+import shutil
+
+from pdf_toolkit import split
+from pdf_toolkit.split import (
+    split_by_pages,
+    split_at_pages,
+    split_into_singles,
+    split_into_singles_async,
+)
+
+
+@pytest.fixture(params=["pypdf", "pikepdf"])
+def backend(request, monkeypatch):
+    """Run each test with the pypdf fallback and, if installed, pikepdf"""
+    if request.param == "pypdf":
+        monkeypatch.setattr(split, "_pikepdf", lambda: None)
+    elif split._pikepdf() is None:
+        pytest.skip("pikepdf is not installed")
+    return request.param
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files"""
+    temp_path = Path(tempfile.mkdtemp())
+    yield temp_path
+    shutil.rmtree(temp_path)
+
+
+@pytest.fixture
+def sample_pdf(temp_dir):
+    """Create a 10-page sample PDF; page N is (100 + N) points wide"""
+    pdf_path = temp_dir / "sample.pdf"
+    writer = PdfWriter()
+    
+    for i in range(10):
+        writer.add_blank_page(width=100 + i, height=792)
+    
+    with open(pdf_path, 'wb') as f:
+        writer.write(f)
+    
+    return pdf_path
+
+
+def page_widths(pdf_path):
+    """Return the width of every page, used to identify pages"""
+    reader = PdfReader(str(pdf_path))
+    return [int(page.mediabox.width) for page in reader.pages]
+
+
+class TestSplitByPages:
+    
+    def test_split_even_chunks(self, backend, sample_pdf):
+        """Test splitting into files of equal size"""
+        results = split_by_pages(str(sample_pdf), 5, show_progress=False)
+        
+        assert [p.name for p in results] == ["sample_1.pdf", "sample_2.pdf"]
+        assert page_widths(results[0]) == [100, 101, 102, 103, 104]
+        assert page_widths(results[1]) == [105, 106, 107, 108, 109]
+    
+    def test_split_with_remainder(self, backend, sample_pdf):
+        """Test that the last file holds the remaining pages"""
+        results = split_by_pages(str(sample_pdf), 4, show_progress=False)
+        
+        assert [len(page_widths(p)) for p in results] == [4, 4, 2]
+        assert page_widths(results[2]) == [108, 109]
+    
+    def test_split_with_worker_processes(self, backend, sample_pdf, monkeypatch):
+        """Test that splitting in worker processes gives the same files"""
+        monkeypatch.setattr(
+            split, "_pick_executor", lambda *times: ProcessPoolExecutor
+        )
+        
+        results = split_by_pages(
+            str(sample_pdf), 3, show_progress=False, num_workers=2
+        )
+        
+        assert [page_widths(p) for p in results] == [
+            [100, 101, 102], [103, 104, 105], [106, 107, 108], [109]
+        ]
+    
+    def test_split_with_worker_threads(self, backend, sample_pdf, monkeypatch):
+        """Test the thread pool picked for splits that wait on the disk"""
+        monkeypatch.setattr(
+            split, "_pick_executor", lambda *times: ThreadPoolExecutor
+        )
+        
+        results = split_by_pages(
+            str(sample_pdf), 3, show_progress=False, num_workers=2
+        )
+        
+        assert [page_widths(p) for p in results] == [
+            [100, 101, 102], [103, 104, 105], [106, 107, 108], [109]
+        ]
+    
+    def test_split_with_picked_workers(self, backend, sample_pdf):
+        """Test splitting with the pool picked by timing the first file"""
+        results = split_by_pages(
+            str(sample_pdf), 2, show_progress=False, num_workers=2
+        )
+        
+        assert [p.name for p in results] == [
+            f"sample_{num}.pdf" for num in range(1, 6)
+        ]
+        assert [page_widths(p) for p in results] == [
+            [100, 101], [102, 103], [104, 105], [106, 107], [108, 109]
+        ]
+    
+    def test_split_empty_file(self, temp_dir, monkeypatch):
+        """Test that an empty input is reported as an invalid PDF"""
+        monkeypatch.setattr(split, "_pikepdf", lambda: None)
+        empty_pdf = temp_dir / "empty.pdf"
+        empty_pdf.touch()
+        
+        with pytest.raises(ValueError, match="Invalid PDF file"):
+            split_by_pages(str(empty_pdf), 5, show_progress=False)
+    
+    def test_split_invalid_page_count(self, sample_pdf):
+        """Test that pages_per_split must be positive"""
+        with pytest.raises(ValueError):
+            split_by_pages(str(sample_pdf), 0, show_progress=False)
+    
+    def test_split_overwrite_false(self, backend, sample_pdf):
+        """Test that split doesn't overwrite by default"""
+        split_by_pages(str(sample_pdf), 5, show_progress=False)
+        
+        with pytest.raises(FileExistsError):
+            split_by_pages(str(sample_pdf), 5, show_progress=False)
+    
+    def test_split_pattern_with_subdirectory(self, backend, sample_pdf):
+        """Test that directories in the output pattern are created"""
+        results = split_by_pages(
+            str(sample_pdf),
+            5,
+            output_pattern="parts/{base}_{num}.pdf",
+            show_progress=False
+        )
+        
+        assert results[0] == sample_pdf.parent / "parts" / "sample_1.pdf"
+        assert [len(page_widths(p)) for p in results] == [5, 5]
+
+
+class TestPickExecutor:
+    
+    def test_cpu_bound_uses_processes(self):
+        """Test that a split keeping the CPU busy picks processes"""
+        assert split._pick_executor(1.0, 0.9) is ProcessPoolExecutor
+    
+    def test_io_bound_uses_threads(self):
+        """Test that a split mostly waiting on the disk picks threads"""
+        assert split._pick_executor(1.0, 0.1) is ThreadPoolExecutor
+    
+    def test_zero_time_uses_processes(self):
+        """Test that an unmeasurably fast split falls back to processes"""
+        assert split._pick_executor(0.0, 0.0) is ProcessPoolExecutor
+
+
+class TestSplitAtPages:
+    
+    def test_split_at_pages(self, backend, sample_pdf):
+        """Test splitting at specific page numbers"""
+        results = split_at_pages(str(sample_pdf), [4, 8])
+        
+        assert page_widths(results[0]) == [100, 101, 102]
+        assert page_widths(results[1]) == [103, 104, 105, 106]
+        assert page_widths(results[2]) == [107, 108, 109]
+    
+    def test_split_at_invalid_page(self, backend, sample_pdf):
+        """Test that split points must be inside the document"""
+        with pytest.raises(ValueError):
+            split_at_pages(str(sample_pdf), [11])
+
+
+class TestSplitIntoSingles:
+    
+    def test_split_into_singles(self, backend, sample_pdf, temp_dir):
+        """Test extracting every page into its own file"""
+        out_dir = temp_dir / "pages"
+        
+        results = split_into_singles(
+            str(sample_pdf),
+            output_dir=str(out_dir),
+            show_progress=False
+        )
+        
+        assert len(results) == 10
+        assert results[0] == out_dir / "sample_page1.pdf"
+        assert [page_widths(p) for p in results] == [[100 + i] for i in range(10)]
+    
+    def test_split_into_singles_with_worker_processes(
+        self, backend, sample_pdf, temp_dir, monkeypatch
+    ):
+        """Test extracting pages in worker processes"""
+        monkeypatch.setattr(
+            split, "_pick_executor", lambda *times: ProcessPoolExecutor
+        )
+        
+        results = split_into_singles(
+            str(sample_pdf),
+            output_dir=str(temp_dir / "pages"),
+            show_progress=False,
+            num_workers=3
+        )
+        
+        assert [page_widths(p) for p in results] == [[100 + i] for i in range(10)]
+    
+    def test_split_into_singles_async(self, backend, sample_pdf, temp_dir):
+        """Test extracting pages from a coroutine"""
+        results = asyncio.run(
+            split_into_singles_async(
+                str(sample_pdf),
+                output_dir=str(temp_dir / "pages")
+            )
+        )
+        
+        assert [page_widths(p) for p in results] == [[100 + i] for i in range(10)]
+    
+    def test_split_into_singles_async_uses_threads(
+        self, backend, sample_pdf, temp_dir, monkeypatch
+    ):
+        """Test that the async variant never starts a process pool"""
+        monkeypatch.setattr(
+            split,
+            "_pick_executor",
+            lambda *times: pytest.fail("the pool must not be picked by timing")
+        )
+        
+        results = asyncio.run(
+            split_into_singles_async(
+                str(sample_pdf),
+                output_dir=str(temp_dir / "pages"),
+                num_workers=2
+            )
+        )
+        
+        assert [page_widths(p) for p in results] == [[100 + i] for i in range(10)]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
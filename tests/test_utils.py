@@ -0,0 +1,110 @@
+"""
+Tests for utility functions
+"""
+
+import contextlib
+import io
+import pytest
+
+from pdf_toolkit.utils import format_file_size, parse_page_ranges, print_info
+
+
+class TestParsePageRanges:
+    
+    def test_single_pages(self):
+        """Test single page numbers become 0-indexed pages"""
+        assert parse_page_ranges("1,3,5", 10) == [0, 2, 4]
+    
+    def test_range(self):
+        """Test a range includes both ends"""
+        assert parse_page_ranges("1-5", 10) == [0, 1, 2, 3, 4]
+    
+    def test_mixed_and_unsorted(self):
+        """Test pages and ranges combine into a sorted list"""
+        assert parse_page_ranges("10,3-5,1", 10) == [0, 2, 3, 4, 9]
+    
+    def test_overlapping_ranges(self):
+        """Test pages selected more than once appear once"""
+        assert parse_page_ranges("1-3,2-4,3", 10) == [0, 1, 2, 3]
+    
+    def test_whitespace(self):
+        """Test spaces around pages, dashes and commas are ignored"""
+        assert parse_page_ranges(" 1 , 3 - 5 ,10 ", 10) == [0, 2, 3, 4, 9]
+    
+    def test_full_document(self):
+        """Test a range covering every page"""
+        assert parse_page_ranges("1-10", 10) == list(range(10))
+    
+    @pytest.mark.parametrize("range_string, message", [
+        ("1-", "Invalid range format: 1-"),
+        ("-3", "Invalid range format: -3"),
+        ("1-2-3", "Invalid range format: 1-2-3"),
+        ("a", "Invalid page number: a"),
+        ("1,,2", "Invalid page number: "),
+    ])
+    def test_malformed(self, range_string, message):
+        """Test malformed tokens are rejected"""
+        with pytest.raises(ValueError) as exc_info:
+            parse_page_ranges(range_string, 10)
+        
+        assert str(exc_info.value) == message
+    
+    @pytest.mark.parametrize("range_string, message", [
+        ("0", "Invalid page number: 0. Must be between 1 and 10"),
+        ("11", "Invalid page number: 11. Must be between 1 and 10"),
+        ("5-3", "Invalid range: 5-3. Must be between 1 and 10"),
+        ("0-3", "Invalid range: 0-3. Must be between 1 and 10"),
+        ("8-11", "Invalid range: 8-11. Must be between 1 and 10"),
+    ])
+    def test_out_of_bounds(self, range_string, message):
+        """Test pages outside the document are rejected"""
+        with pytest.raises(ValueError) as exc_info:
+            parse_page_ranges(range_string, 10)
+        
+        assert str(exc_info.value) == message
+
+
+class TestFormatFileSize:
+    
+    @pytest.mark.parametrize("size_bytes, expected", [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (2 ** 20 - 1, "1024.0 KB"),
+        (2 ** 20, "1.0 MB"),
+        (2 ** 40, "1.0 TB"),
+        (2 ** 50, "1024.0 TB"),
+        (-2048, "-2048.0 B"),
+    ])
+    def test_unit_boundaries(self, size_bytes, expected):
+        """Test the unit changes at each power of 1024"""
+        assert format_file_size(size_bytes) == expected
+
+
+
+class _TerminalStream(io.StringIO):
+    """In-memory stream that claims to be a terminal"""
+    
+    def isatty(self):
+        return True
+
+
+class TestColors:
+    
+    def test_colors_follow_replaced_stdout(self):
+        """Test colors are decided again when stdout is swapped"""
+        terminal = _TerminalStream()
+        with contextlib.redirect_stdout(terminal):
+            print_info("first")
+        
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            print_info("second")
+        
+        assert "\x1b[" in terminal.getvalue()
+        assert captured.getvalue() == "ℹ second\n"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])